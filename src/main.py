@@ -35,6 +35,17 @@ def read_calc_int(iric, fid, name, default=None):
         return default
 
 
+def read_calc_real(iric, fid, name, default=None):
+    try:
+        value = iric.cg_iRIC_Read_Real(fid, name)
+    except Exception:
+        return default
+    try:
+        return float(value)
+    except Exception:
+        return default
+
+
 def run_from_iric(cgn_path):
     solver_dir = Path(__file__).resolve().parent
 
@@ -77,6 +88,20 @@ def run_from_iric(cgn_path):
     thin_step_value = read_calc_int(iric, fid, "thin_step", default=2)
     thin_keep_last_value = read_calc_int(iric, fid, "thin_keep_last", default=1)
     dry_run_value = read_calc_int(iric, fid, "dry_run", default=0)
+    verify_value = read_calc_int(iric, fid, "verify", default=0)
+    merge_mode_value = read_calc_int(iric, fid, "merge_mode", default=0)
+    output_format_value = read_calc_int(iric, fid, "output_format", default=0)
+    keyframe_interval_value = read_calc_int(
+        iric, fid, "keyframe_interval", default=10
+    )
+    shard_mode_value = read_calc_int(iric, fid, "shard_mode", default=0)
+    shard_max_steps_value = read_calc_int(iric, fid, "shard_max_steps", default=100)
+    shard_max_size_value = read_calc_real(
+        iric, fid, "shard_max_size_mb", default=10240.0
+    )
+    shard_time_window_value = read_calc_real(
+        iric, fid, "shard_time_window", default=3600.0
+    )
     iric.cg_iRIC_Close(fid)
 
     if input_type not in (0, 1, 2):
@@ -102,6 +127,9 @@ def run_from_iric(cgn_path):
     thin_mode = "every_n" if thin_mode_value == 1 else "none"
     thin_step = str(thin_step_value if thin_step_value is not None else 2)
     thin_keep_last = "true" if thin_keep_last_value == 1 else "false"
+    merge_mode = "link" if merge_mode_value == 1 else "copy"
+    shard_modes = {1: "steps", 2: "size", 3: "time"}
+    shard_mode = shard_modes.get(shard_mode_value, "none")
 
     cmd = [
         "cmd",
@@ -122,15 +150,41 @@ def run_from_iric(cgn_path):
         thin_step,
         "--thin-keep-last",
         thin_keep_last,
+        "--merge-mode",
+        merge_mode,
     ]
     if input_type in (0, 1):
         cmd.extend(["--project", project_path, "--result-dir", result_subdir])
     else:
         cmd.extend(["--result-dir-input", project_path])
+        if output_format_value == 1:
+            cmd.extend(
+                [
+                    "--output-format",
+                    "archive",
+                    "--keyframe-interval",
+                    str(keyframe_interval_value),
+                ]
+            )
+        if shard_mode != "none":
+            cmd.extend(
+                [
+                    "--shard-mode",
+                    shard_mode,
+                    "--shard-max-steps",
+                    str(shard_max_steps_value),
+                    "--shard-max-size-mb",
+                    str(shard_max_size_value),
+                    "--shard-time-window",
+                    str(shard_time_window_value),
+                ]
+            )
     if output_name_mode == 1 and output_cgns_name:
         cmd.extend(["--output-cgns-name", output_cgns_name])
     if dry_run_value == 1:
         cmd.append("--dry-run")
+    if verify_value == 1:
+        cmd.append("--verify")
 
     result = subprocess.run(cmd, cwd=str(solver_dir))
     return result.returncode
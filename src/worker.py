@@ -1,9 +1,13 @@
 import argparse
+import hashlib
+import json
+import math
 import os
 import re
 import shutil
 import sys
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 import h5py
@@ -16,6 +20,9 @@ class MergerError(Exception):
         self.exit_code = exit_code
         self.allow_skip = allow_skip
 
+    def __reduce__(self):
+        return (self.__class__, (str(self), self.exit_code, self.allow_skip))
+
 
 POINTER_DATASETS = [
     "FlowSolutionPointers",
@@ -294,7 +301,146 @@ def update_zone_pointers(output_file, pointer_outputs, pointer_widths):
         group.create_dataset(" data", data=encode_cgns_names(names, width))
 
 
-def copy_solution_groups(output_file, entries, pointer_templates):
+CHECKSUM_BLOCK_BYTES = 64 * 1024 * 1024
+
+
+def iter_dataset_blocks(ds):
+    if ds.shape is None:
+        return
+    if ds.ndim == 0:
+        yield (), ds[()]
+        return
+    row_bytes = max(1, ds.dtype.itemsize * int(np.prod(ds.shape[1:])))
+    rows = max(1, CHECKSUM_BLOCK_BYTES // row_bytes)
+    for start in range(0, ds.shape[0], rows):
+        selection = np.s_[start : start + rows]
+        yield selection, ds[selection]
+
+
+def copy_attrs(src, dest):
+    for key in src.attrs:
+        dest.attrs.create(key, src.attrs[key], dtype=src.attrs.get_id(key).dtype)
+
+
+def attrs_checksum(obj):
+    digest = hashlib.sha256()
+    for key in sorted(obj.attrs):
+        dtype = obj.attrs.get_id(key).dtype
+        value = np.asarray(obj.attrs[key])
+        digest.update(key.encode("utf-8"))
+        digest.update(dtype.str.encode("ascii"))
+        if dtype.kind == "O":
+            digest.update(repr(value.tolist()).encode("utf-8"))
+        else:
+            digest.update(np.asarray(value, dtype=dtype).tobytes())
+    return digest.hexdigest()
+
+
+def new_dataset_digest(ds):
+    digest = hashlib.sha256()
+    digest.update(str(ds.dtype).encode("ascii"))
+    digest.update(str(ds.shape).encode("ascii"))
+    digest.update(attrs_checksum(ds).encode("ascii"))
+    return digest
+
+
+def dataset_checksum(ds):
+    digest = new_dataset_digest(ds)
+    for _, block in iter_dataset_blocks(ds):
+        digest.update(np.ascontiguousarray(block).tobytes())
+    return digest.hexdigest()
+
+
+def collect_group_checksums(group):
+    checksums = {"/": attrs_checksum(group)}
+
+    def visit(name, obj):
+        if isinstance(obj, h5py.Group):
+            checksums[f"{name}/"] = attrs_checksum(obj)
+        elif isinstance(obj, h5py.Dataset):
+            checksums[name] = dataset_checksum(obj)
+
+    group.visititems(visit)
+    return checksums
+
+
+def copy_group_with_checksums(src_group, dest_parent, name, checksums, prefix=""):
+    dest_group = dest_parent.create_group(name)
+    copy_attrs(src_group, dest_group)
+    checksums[prefix or "/"] = attrs_checksum(src_group)
+
+    for child_name, child in src_group.items():
+        path = f"{prefix}{child_name}"
+        if isinstance(child, h5py.Group):
+            copy_group_with_checksums(
+                child, dest_group, child_name, checksums, f"{path}/"
+            )
+            continue
+        if not isinstance(child, h5py.Dataset):
+            continue
+
+        if child.shape is None:
+            dest_ds = dest_group.create_dataset(
+                child_name, data=h5py.Empty(child.dtype)
+            )
+        else:
+            dest_ds = dest_group.create_dataset(
+                child_name,
+                shape=child.shape,
+                dtype=child.dtype,
+                chunks=child.chunks,
+                maxshape=child.maxshape if child.chunks else None,
+                compression=child.compression,
+                compression_opts=child.compression_opts,
+                shuffle=child.shuffle,
+                fletcher32=child.fletcher32,
+            )
+        copy_attrs(child, dest_ds)
+
+        digest = new_dataset_digest(child)
+        for selection, block in iter_dataset_blocks(child):
+            dest_ds[selection] = block
+            digest.update(np.ascontiguousarray(block).tobytes())
+        checksums[path] = digest.hexdigest()
+    return dest_group
+
+
+def encode_cgns_string(text):
+    raw = text.encode("utf-8") + b"\0"
+    return np.frombuffer(raw, dtype=np.uint8).astype(np.int8)
+
+
+def link_file_name(source_path, output_path):
+    source_path = Path(source_path).resolve()
+    output_dir = Path(output_path).resolve().parent
+    try:
+        return Path(os.path.relpath(source_path, output_dir)).as_posix()
+    except ValueError:
+        return str(source_path)
+
+
+def create_link_node(zone, name, src_group, file_name):
+    target_path = src_group.name
+    node = zone.create_group(name)
+    copy_attrs(src_group, node)
+    if "name" in src_group.attrs:
+        node.attrs.create("name", src_group.attrs["name"], dtype="S33")
+    node.attrs.create("label", b"", dtype="S33")
+    node.attrs.create("type", b"LK", dtype="S3")
+    node.create_dataset(" file", data=encode_cgns_string(file_name))
+    node.create_dataset(" path", data=encode_cgns_string(target_path))
+    node[" link"] = h5py.ExternalLink(file_name, target_path)
+
+
+def resolve_link_node(group):
+    if " link" not in group:
+        return group
+    return group[" link"]
+
+
+def copy_solution_groups(
+    output_file, entries, pointer_templates, checksums=None, merge_mode="copy"
+):
     zone = output_file.require_group("iRIC/iRICZone")
 
     pointer_outputs = {}
@@ -325,9 +471,340 @@ def copy_solution_groups(output_file, entries, pointer_templates):
                         f"{input_name} が {entry['path'].name} に見つかりません。",
                         exit_code=3,
                     )
-                zone.copy(src_zone[input_name], output_name)
+                if merge_mode == "link":
+                    create_link_node(
+                        zone,
+                        output_name,
+                        src_zone[input_name],
+                        link_file_name(entry["path"], output_file.filename),
+                    )
+                    if checksums is not None:
+                        checksums[output_name] = None
+                elif checksums is not None:
+                    checksums[output_name] = {}
+                    copy_group_with_checksums(
+                        src_zone[input_name],
+                        zone,
+                        output_name,
+                        checksums[output_name],
+                    )
+                else:
+                    zone.copy(src_zone[input_name], output_name)
 
     update_zone_pointers(output_file, pointer_outputs, pointer_widths)
+    return pointer_outputs
+
+
+def write_merged_cgns(
+    output_path, entries, base_values, pointer_templates, verify, merge_mode="copy"
+):
+    checksums = {} if verify else None
+    with open_output_cgns(output_path, entries[0]["path"]) as out_f:
+        pointer_outputs = copy_solution_groups(
+            out_f, entries, pointer_templates, checksums, merge_mode
+        )
+        update_base_iterative_data(out_f, [e["time"] for e in entries], base_values)
+    return pointer_outputs, checksums
+
+
+def resolve_workers(workers):
+    if workers < 0:
+        raise MergerError("並列数は 0 以上で指定してください。", exit_code=2)
+    if workers == 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def verify_group_checksums(output_path, group_name, expected):
+    problems = []
+    with h5py.File(output_path, "r") as f:
+        group = f.get(f"iRIC/iRICZone/{group_name}")
+        if group is None:
+            return [f"{group_name} が出力に見つかりません。"]
+        try:
+            group = resolve_link_node(group)
+        except KeyError:
+            return [f"{group_name} のリンク先を開けません。"]
+        if expected is None:
+            if not isinstance(group, h5py.Group):
+                return [f"{group_name} のリンク先がグループではありません。"]
+            return []
+        actual = collect_group_checksums(group)
+
+    for name, checksum in expected.items():
+        if name not in actual:
+            problems.append(f"{group_name}/{name} が出力に見つかりません。")
+        elif actual[name] != checksum:
+            problems.append(f"{group_name}/{name} のチェックサムが一致しません。")
+    for name in actual:
+        if name not in expected:
+            problems.append(f"{group_name}/{name} は入力に存在しないデータです。")
+    return problems
+
+
+def verify_iterative_data(output_path, step_count, base_values, pointer_outputs):
+    problems = []
+    with h5py.File(output_path, "r") as f:
+        for pointer, names in pointer_outputs.items():
+            ds = f.get(f"iRIC/iRICZone/ZoneIterativeData/{pointer}/ data")
+            if ds is None:
+                problems.append(f"{pointer} が出力に見つかりません。")
+                continue
+            actual = decode_cgns_names(ds[()])
+            if len(actual) != step_count:
+                problems.append(
+                    f"{pointer} の件数が一致しません: {len(actual)} (期待値 {step_count})"
+                )
+            elif actual != names:
+                problems.append(f"{pointer} のポインタ名が一致しません。")
+
+        for name in ["TimeValues", *base_values.keys()]:
+            ds = f.get(f"iRIC/BaseIterativeData/{name}/ data")
+            if ds is None:
+                problems.append(f"BaseIterativeData の {name} が出力に見つかりません。")
+            elif ds.shape[0] != step_count:
+                problems.append(
+                    f"BaseIterativeData の {name} の件数が一致しません: "
+                    f"{ds.shape[0]} (期待値 {step_count})"
+                )
+    return problems
+
+
+def verify_merged_cgns(
+    output_path, step_count, base_values, pointer_outputs, checksums, workers
+):
+    workers = resolve_workers(workers)
+    dataset_count = sum(
+        1
+        for expected in checksums.values()
+        for name in expected or {}
+        if not name.endswith("/")
+    )
+    link_count = sum(1 for expected in checksums.values() if expected is None)
+    if link_count:
+        print(f"検証開始: リンク {link_count} 件 (並列数 {workers})")
+    else:
+        print(
+            f"検証開始: グループ {len(checksums)} 件 / データセット {dataset_count} 件 "
+            f"(並列数 {workers})"
+        )
+
+    problems = verify_iterative_data(
+        output_path, step_count, base_values, pointer_outputs
+    )
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(verify_group_checksums, output_path, name, expected)
+            for name, expected in checksums.items()
+        ]
+        for future in as_completed(futures):
+            problems.extend(future.result())
+
+    for problem in problems:
+        print(f"  NG: {problem}")
+    if problems:
+        print(f"検証結果: 不合格 ({len(problems)} 件)")
+        raise MergerError("出力CGNSの検証に失敗しました。", exit_code=5)
+    print("検証結果: 合格")
+
+
+def plan_shards(
+    entries, shard_mode, shard_max_steps, shard_max_size_mb, shard_time_window
+):
+    if shard_mode == "none":
+        return [(0, len(entries))]
+
+    if shard_mode == "steps":
+        if shard_max_steps < 1:
+            raise MergerError(
+                "シャードの最大ステップ数は 1 以上で指定してください。", exit_code=2
+            )
+        keys = [i // shard_max_steps for i in range(len(entries))]
+    elif shard_mode == "size":
+        if shard_max_size_mb <= 0:
+            raise MergerError(
+                "シャードの最大サイズは 0 より大きい値で指定してください。", exit_code=2
+            )
+        limit = shard_max_size_mb * 1024 * 1024
+        keys = []
+        key = 0
+        current = 0
+        for entry in entries:
+            size = entry["path"].stat().st_size
+            if current > 0 and current + size > limit:
+                key += 1
+                current = 0
+            current += size
+            keys.append(key)
+    elif shard_mode == "time":
+        if shard_time_window <= 0:
+            raise MergerError(
+                "シャードの時間幅は 0 より大きい値で指定してください。", exit_code=2
+            )
+        start_time = entries[0]["time"]
+        keys = [
+            math.floor((entry["time"] - start_time) / shard_time_window)
+            for entry in entries
+        ]
+    else:
+        raise MergerError(f"不正なシャードモードです: {shard_mode}", exit_code=2)
+
+    ranges = []
+    start = 0
+    for i in range(1, len(entries)):
+        if keys[i] != keys[i - 1]:
+            ranges.append((start, i))
+            start = i
+    ranges.append((start, len(entries)))
+    return ranges
+
+
+def shard_output_name(output_cgns_name, index):
+    path = Path(output_cgns_name)
+    return f"{path.stem}_{index:03d}{path.suffix}"
+
+
+def shard_manifest_path(output_dir, output_cgns_name):
+    return output_dir / f"{Path(output_cgns_name).stem}_manifest.json"
+
+
+def remove_old_shards(output_dir, output_cgns_name, shard_paths):
+    path = Path(output_cgns_name)
+    shard_pattern = re.compile(
+        rf"{re.escape(path.stem)}_\d{{3,}}{re.escape(path.suffix)}", re.IGNORECASE
+    )
+    manifest_path = shard_manifest_path(output_dir, output_cgns_name)
+    old_files = set()
+    if manifest_path.exists():
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as fp:
+                manifest = json.load(fp)
+            old_files = {shard["file"] for shard in manifest["shards"]}
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            raise MergerError(
+                f"既存のマニフェストを読み込めません: {manifest_path.name}",
+                exit_code=2,
+            ) from exc
+        old_files = {name for name in old_files if shard_pattern.fullmatch(name)}
+
+    for shard_path in shard_paths:
+        if shard_path.exists() and shard_path.name not in old_files:
+            raise MergerError(
+                "出力先にマニフェストに記載の無い同名ファイルがあります: "
+                f"{shard_path.name}",
+                exit_code=2,
+            )
+
+    for name in sorted(old_files):
+        old_path = output_dir / name
+        if not old_path.exists():
+            continue
+        try:
+            old_path.unlink()
+        except OSError as exc:
+            raise MergerError(
+                f"既存のシャードを削除できません: {old_path.name}", exit_code=4
+            ) from exc
+        print(f"既存のシャードを削除しました: {old_path.name}")
+    if manifest_path.exists():
+        manifest_path.unlink()
+
+
+def write_sharded_output(
+    output_dir,
+    output_cgns_name,
+    entries,
+    base_values,
+    pointer_templates,
+    shard_ranges,
+    verify,
+    workers,
+    merge_mode="copy",
+):
+    workers = resolve_workers(workers)
+    shards = []
+    for index, (start, stop) in enumerate(shard_ranges, start=1):
+        shards.append(
+            {
+                "path": output_dir / shard_output_name(output_cgns_name, index),
+                "entries": entries[start:stop],
+                "base_values": {
+                    name: values[start:stop] for name, values in base_values.items()
+                },
+            }
+        )
+    print(f"シャード数: {len(shards)} (並列数 {min(workers, len(shards))})")
+    remove_old_shards(
+        output_dir, output_cgns_name, [shard["path"] for shard in shards]
+    )
+
+    results = {}
+    if workers == 1 or len(shards) == 1:
+        for shard in shards:
+            results[shard["path"]] = write_merged_cgns(
+                shard["path"],
+                shard["entries"],
+                shard["base_values"],
+                pointer_templates,
+                verify,
+                merge_mode,
+            )
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as executor:
+            futures = {
+                executor.submit(
+                    write_merged_cgns,
+                    shard["path"],
+                    shard["entries"],
+                    shard["base_values"],
+                    pointer_templates,
+                    verify,
+                    merge_mode,
+                ): shard["path"]
+                for shard in shards
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+    manifest_shards = []
+    for shard in shards:
+        shard_entries = shard["entries"]
+        print(
+            f"シャード出力: {shard['path'].name} "
+            f"({len(shard_entries)} ステップ, 時刻 {shard_entries[0]['time']} - "
+            f"{shard_entries[-1]['time']})"
+        )
+        if verify:
+            pointer_outputs, checksums = results[shard["path"]]
+            verify_merged_cgns(
+                shard["path"],
+                len(shard_entries),
+                shard["base_values"],
+                pointer_outputs,
+                checksums,
+                workers,
+            )
+        manifest_shards.append(
+            {
+                "file": shard["path"].name,
+                "steps": len(shard_entries),
+                "time_start": shard_entries[0]["time"],
+                "time_end": shard_entries[-1]["time"],
+                "sources": [entry["path"].name for entry in shard_entries],
+            }
+        )
+
+    manifest_path = shard_manifest_path(output_dir, output_cgns_name)
+    manifest = {
+        "total_steps": len(entries),
+        "shards": manifest_shards,
+    }
+    try:
+        with open(manifest_path, "w", encoding="utf-8") as fp:
+            json.dump(manifest, fp, ensure_ascii=False, indent=2)
+    except OSError as exc:
+        raise MergerError("マニフェストを書き込めません。", exit_code=4) from exc
+    return manifest_path
 
 
 def merge_project(
@@ -342,6 +819,9 @@ def merge_project(
     thin_keep_last,
     dry_run,
     output_cgns_name,
+    verify=False,
+    workers=0,
+    merge_mode="copy",
 ):
     if not output_cgns_name:
         output_cgns_name = "Case1.cgn"
@@ -384,12 +864,18 @@ def merge_project(
         return project_type, None, None, True
 
     base_cgns = output_root / output_cgns_name
-    with open_output_cgns(base_cgns, entries[0]["path"]) as out_f:
-        copy_solution_groups(out_f, entries, pointer_templates)
-        update_base_iterative_data(out_f, [e["time"] for e in entries], base_values)
+    pointer_outputs, checksums = write_merged_cgns(
+        base_cgns, entries, base_values, pointer_templates, verify, merge_mode
+    )
+    if verify:
+        verify_merged_cgns(
+            base_cgns, len(entries), base_values, pointer_outputs, checksums, workers
+        )
 
     result_output_dir = output_root / result_dir
-    if result_output_dir.exists():
+    if merge_mode == "link":
+        print("リンクモードのため分割CGNSフォルダを残します。")
+    elif result_output_dir.exists():
         shutil.rmtree(result_output_dir)
 
     if project_type == "ipro":
@@ -415,6 +901,15 @@ def merge_result_dir(
     thin_keep_last,
     dry_run,
     output_cgns_name,
+    verify=False,
+    workers=0,
+    shard_mode="none",
+    shard_max_steps=100,
+    shard_max_size_mb=10240.0,
+    shard_time_window=3600.0,
+    merge_mode="copy",
+    output_format="cgns",
+    keyframe_interval=10,
 ):
     if not output_cgns_name:
         output_cgns_name = "Case1.cgn"
@@ -450,20 +945,394 @@ def merge_result_dir(
         raise MergerError("有効なCGNSがありません。", exit_code=2)
     print(f"採用ファイル数: {len(entries)}")
 
+    shard_ranges = plan_shards(
+        entries, shard_mode, shard_max_steps, shard_max_size_mb, shard_time_window
+    )
+
     if dry_run:
+        if shard_mode != "none":
+            print(f"シャード数: {len(shard_ranges)}")
         print("dry-runのため出力を作成しません。")
         return None, True
 
     output_dir.mkdir(parents=True, exist_ok=True)
+    if output_format == "archive":
+        archive_path = output_dir / f"{Path(output_cgns_name).stem}.cgnarc"
+        write_archive(
+            archive_path, entries, base_values, pointer_templates, keyframe_interval
+        )
+        return archive_path, False
+
+    if shard_mode != "none":
+        manifest_path = write_sharded_output(
+            output_dir,
+            output_cgns_name,
+            entries,
+            base_values,
+            pointer_templates,
+            shard_ranges,
+            verify,
+            workers,
+            merge_mode,
+        )
+        return manifest_path, False
+
     output_path = output_dir / output_cgns_name
 
-    with open_output_cgns(output_path, entries[0]["path"]) as out_f:
-        copy_solution_groups(out_f, entries, pointer_templates)
-        update_base_iterative_data(out_f, [e["time"] for e in entries], base_values)
+    pointer_outputs, checksums = write_merged_cgns(
+        output_path, entries, base_values, pointer_templates, verify, merge_mode
+    )
+    if verify:
+        verify_merged_cgns(
+            output_path, len(entries), base_values, pointer_outputs, checksums, workers
+        )
 
     return output_path, False
 
 
+def materialize_linked_cgns(input_path, output_dir, output_cgns_name):
+    if not input_path.is_file():
+        raise MergerError("リンク形式のCGNSが見つかりません。", exit_code=2)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / (output_cgns_name or input_path.name)
+    if output_path.resolve() == input_path.resolve():
+        raise MergerError("入力と同じファイルには出力できません。", exit_code=2)
+    try:
+        shutil.copy(input_path, output_path)
+    except OSError as exc:
+        raise MergerError("出力ファイルを作成できません。", exit_code=4) from exc
+
+    resolved = 0
+    with h5py.File(output_path, "r+") as out_f:
+        zone = out_f.get("iRIC/iRICZone")
+        if zone is None:
+            raise MergerError("iRICZone が見つかりません。", exit_code=3)
+
+        for name in list(zone.keys()):
+            node = zone[name]
+            if not isinstance(node, h5py.Group):
+                continue
+            link = node.get(" link", getlink=True)
+            if not isinstance(link, h5py.ExternalLink):
+                continue
+            source_path = Path(link.filename)
+            if not source_path.is_absolute():
+                source_path = input_path.parent / source_path
+            if not source_path.exists():
+                raise MergerError(
+                    f"{name} のリンク先が見つかりません: {link.filename}", exit_code=3
+                )
+            with h5py.File(source_path, "r") as src:
+                if link.path not in src:
+                    raise MergerError(
+                        f"{name} のリンク先が見つかりません: {link.path}", exit_code=3
+                    )
+                del zone[name]
+                zone.copy(src[link.path], name)
+            resolved += 1
+
+    print(f"リンク解決数: {resolved}")
+    return output_path
+
+
+ARCHIVE_FORMAT = "CgnTM-archive"
+ARCHIVE_VERSION = 1
+
+
+def is_encodable_dataset(ds):
+    if ds.shape is None or 0 in ds.shape:
+        return False
+    return ds.dtype.kind in "iuf"
+
+
+def bits_dtype(dtype):
+    return np.dtype(f"u{dtype.itemsize}")
+
+
+def collect_encodable_fields(group):
+    fields = []
+
+    def visit(name, obj):
+        if isinstance(obj, h5py.Dataset) and is_encodable_dataset(obj):
+            fields.append(name)
+
+    group.visititems(visit)
+    return fields
+
+
+def attrs_signature(obj):
+    items = []
+    for key, value in obj.attrs.items():
+        array = np.asarray(value)
+        if array.dtype.kind == "O":
+            items.append((key, "O", repr(array.tolist())))
+        else:
+            items.append((key, array.dtype.str, array.tobytes()))
+    return tuple(sorted(items))
+
+
+def group_signature(group, encoded_paths):
+    signature = {"": ("group", attrs_signature(group))}
+
+    def visit(name, obj):
+        if isinstance(obj, h5py.Group):
+            signature[name] = ("group", attrs_signature(obj))
+        elif isinstance(obj, h5py.Dataset):
+            data = None
+            if name not in encoded_paths and obj.shape is not None:
+                data = np.ascontiguousarray(obj[()]).tobytes()
+            signature[name] = (
+                "dataset",
+                obj.dtype.str,
+                obj.shape,
+                attrs_signature(obj),
+                data,
+            )
+
+    group.visititems(visit)
+    return signature
+
+
+def write_archive(
+    archive_path, entries, base_values, pointer_templates, keyframe_interval
+):
+    if keyframe_interval < 1:
+        raise MergerError("キーフレーム間隔は 1 以上で指定してください。", exit_code=2)
+
+    temp_path = archive_path.with_name(f"{archive_path.name}.tmp")
+    try:
+        arc = h5py.File(temp_path, "w")
+    except OSError as exc:
+        raise MergerError("アーカイブを作成できません。", exit_code=4) from exc
+
+    try:
+        with arc:
+            write_archive_contents(
+                arc, entries, base_values, pointer_templates, keyframe_interval
+            )
+            arc.attrs["complete"] = True
+        try:
+            os.replace(temp_path, archive_path)
+        except OSError as exc:
+            raise MergerError("アーカイブを書き込めません。", exit_code=4) from exc
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return archive_path
+
+
+def write_archive_contents(
+    arc, entries, base_values, pointer_templates, keyframe_interval
+):
+    step_count = len(entries)
+    keyframe_count = (step_count + keyframe_interval - 1) // keyframe_interval
+    arc.attrs["format"] = ARCHIVE_FORMAT
+    arc.attrs["version"] = ARCHIVE_VERSION
+    arc.attrs["keyframe_interval"] = keyframe_interval
+    arc.attrs["step_count"] = step_count
+    arc.create_dataset("times", data=np.array([e["time"] for e in entries]))
+    base_group = arc.create_group("base")
+    for name, values in base_values.items():
+        base_group.create_dataset(name, data=np.array(values, dtype=np.float64))
+
+    try:
+        template_bytes = entries[0]["path"].read_bytes()
+    except OSError as exc:
+        raise MergerError(
+            f"{entries[0]['path'].name} を読み込めません。", exit_code=3
+        ) from exc
+    arc.create_dataset(
+        "template_file",
+        data=np.frombuffer(template_bytes, dtype=np.uint8),
+        compression="gzip",
+    )
+
+    fields = {}
+    signatures = {}
+    with h5py.File(entries[0]["path"], "r") as src:
+        template_zone = src.get("iRIC/iRICZone")
+        if template_zone is None:
+            raise MergerError("iRICZone が見つかりません。", exit_code=3)
+        fields_group = arc.create_group("fields")
+        for pointer, pointer_template in pointer_templates.items():
+            input_name = pointer_template["input_name"]
+            if input_name not in template_zone:
+                raise MergerError(
+                    f"{input_name} が {entries[0]['path'].name} に見つかりません。",
+                    exit_code=3,
+                )
+            pointer_group = fields_group.create_group(pointer)
+            pointer_group.attrs["input_name"] = input_name
+            pointer_group.attrs["width"] = pointer_template["width"]
+
+            layout = template_zone[input_name]
+            field_paths = collect_encodable_fields(layout)
+            signatures[pointer] = group_signature(layout, set(field_paths))
+            fields[pointer] = []
+            for field_index, path in enumerate(field_paths):
+                ds = layout[path]
+                field_group = pointer_group.create_group(f"field{field_index}")
+                field_group.attrs["path"] = path
+                chunks = (1, *ds.shape)
+                keyframes = field_group.create_dataset(
+                    "keyframes",
+                    shape=(keyframe_count, *ds.shape),
+                    dtype=ds.dtype,
+                    chunks=chunks,
+                    compression="gzip",
+                    shuffle=True,
+                )
+                deltas = field_group.create_dataset(
+                    "deltas",
+                    shape=(step_count, *ds.shape),
+                    dtype=bits_dtype(ds.dtype),
+                    chunks=chunks,
+                    compression="gzip",
+                    shuffle=True,
+                )
+                fields[pointer].append(
+                    {
+                        "path": path,
+                        "dtype": ds.dtype,
+                        "shape": ds.shape,
+                        "keyframes": keyframes,
+                        "deltas": deltas,
+                        "previous": None,
+                    }
+                )
+
+    for index, entry in enumerate(entries):
+        with h5py.File(entry["path"], "r") as src:
+            src_zone = src.get("iRIC/iRICZone")
+            if src_zone is None:
+                raise MergerError("iRICZone が見つかりません。", exit_code=3)
+
+            for pointer, pointer_template in pointer_templates.items():
+                input_name = pointer_template["input_name"]
+                src_group = src_zone.get(input_name)
+                if src_group is None:
+                    raise MergerError(
+                        f"{input_name} が {entry['path'].name} に見つかりません。",
+                        exit_code=3,
+                    )
+                encoded_paths = {field["path"] for field in fields[pointer]}
+                if group_signature(src_group, encoded_paths) != signatures[pointer]:
+                    raise MergerError(
+                        f"{input_name} の構造が {entry['path'].name} で先頭ステップと"
+                        "一致しません。アーカイブ出力では数値データ以外の変化に"
+                        "対応していません。",
+                        exit_code=3,
+                    )
+                for field in fields[pointer]:
+                    ds = src_group[field["path"]]
+                    value = np.ascontiguousarray(ds[()])
+                    bits = value.view(bits_dtype(value.dtype))
+                    if index % keyframe_interval == 0:
+                        field["keyframes"][index // keyframe_interval] = value
+                    else:
+                        field["deltas"][index] = bits ^ field["previous"]
+                    field["previous"] = bits
+
+
+def decode_archive_field(field_group, index, keyframe_interval, state):
+    keyframe_index = index - index % keyframe_interval
+    if state is None or not keyframe_index <= state["index"] <= index:
+        keyframe = field_group["keyframes"][keyframe_index // keyframe_interval]
+        state = {
+            "index": keyframe_index,
+            "dtype": keyframe.dtype,
+            "bits": keyframe.view(bits_dtype(keyframe.dtype)).copy(),
+        }
+    deltas = field_group["deltas"]
+    while state["index"] < index:
+        state["index"] += 1
+        state["bits"] ^= deltas[state["index"]]
+    return state["bits"].view(state["dtype"]), state
+
+
+def rehydrate_archive(archive_path, output_dir, output_cgns_name, time_start, time_end):
+    if not archive_path.is_file():
+        raise MergerError("アーカイブが見つかりません。", exit_code=2)
+
+    try:
+        arc = h5py.File(archive_path, "r")
+    except OSError as exc:
+        raise MergerError("アーカイブを開けません。", exit_code=2) from exc
+
+    with arc:
+        if arc.attrs.get("format") != ARCHIVE_FORMAT:
+            raise MergerError("CgnTM のアーカイブではありません。", exit_code=2)
+        if int(arc.attrs["version"]) > ARCHIVE_VERSION:
+            raise MergerError("未対応のアーカイブバージョンです。", exit_code=2)
+        if not arc.attrs.get("complete", False):
+            raise MergerError(
+                "アーカイブが不完全です。作成途中で中断された可能性があります。",
+                exit_code=3,
+            )
+        keyframe_interval = int(arc.attrs["keyframe_interval"])
+
+        times = arc["times"][()]
+        selected = [
+            i
+            for i, t in enumerate(times)
+            if (time_start is None or t >= time_start)
+            and (time_end is None or t <= time_end)
+        ]
+        if not selected:
+            raise MergerError("指定した時刻範囲にステップがありません。", exit_code=2)
+        print(f"復元ステップ数: {len(selected)} / {len(times)}")
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_path = output_dir / (output_cgns_name or "Case1.cgn")
+        try:
+            output_path.write_bytes(arc["template_file"][()].tobytes())
+            out_f = h5py.File(output_path, "r+")
+        except OSError as exc:
+            raise MergerError("出力CGNSを作成できません。", exit_code=4) from exc
+
+        with out_f:
+            zone = out_f["iRIC/iRICZone"]
+            layout_names = {}
+            for pointer, pointer_group in arc["fields"].items():
+                input_name = pointer_group.attrs["input_name"]
+                if input_name not in zone:
+                    raise MergerError(
+                        f"{input_name} がアーカイブ内のテンプレートに見つかりません。",
+                        exit_code=3,
+                    )
+                layout_names[pointer] = f"_layout_{input_name}"
+                zone.move(input_name, layout_names[pointer])
+
+            pointer_outputs = {}
+            pointer_widths = {}
+            for pointer, pointer_group in arc["fields"].items():
+                input_name = pointer_group.attrs["input_name"]
+                pointer_widths[pointer] = int(pointer_group.attrs["width"])
+                pointer_outputs[pointer] = []
+                field_groups = list(pointer_group.values())
+                states = [None] * len(field_groups)
+                for output_index, index in enumerate(selected, start=1):
+                    output_name = rename_with_index(input_name, output_index)
+                    zone.copy(zone[layout_names[pointer]], output_name)
+                    for i, field_group in enumerate(field_groups):
+                        value, states[i] = decode_archive_field(
+                            field_group, index, keyframe_interval, states[i]
+                        )
+                        zone[output_name][field_group.attrs["path"]][...] = value
+                    pointer_outputs[pointer].append(output_name)
+
+            for layout_name in layout_names.values():
+                del zone[layout_name]
+            update_zone_pointers(out_f, pointer_outputs, pointer_widths)
+            base_values = {
+                name: ds[()][selected] for name, ds in arc["base"].items()
+            }
+            update_base_iterative_data(out_f, times[selected], base_values)
+
+    return output_path
+
+
 def build_parser():
     parser = argparse.ArgumentParser(
         description="iRICの分割CGNSを単一プロジェクトに統合します。"
@@ -473,6 +1342,14 @@ def build_parser():
         "--result-dir-input",
         help="分割CGNSのresultフォルダを直接指定",
     )
+    parser.add_argument(
+        "--materialize",
+        help="リンク形式のCGNSを自己完結したCGNSに変換",
+    )
+    parser.add_argument(
+        "--rehydrate",
+        help="アーカイブから時系列CGNSを復元",
+    )
     parser.add_argument("--output-dir", required=True, help="出力先ディレクトリ")
     parser.add_argument(
         "--result-dir", default="result", help="分割CGNS格納フォルダ名"
@@ -514,6 +1391,69 @@ def build_parser():
         help="間引き時に末尾ステップを必ず採用するか (true/false)",
     )
     parser.add_argument("--dry-run", action="store_true", help="検査のみ実行")
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="出力後にチェックサムとポインタ整合性を検証",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="並列処理のワーカー数 (0: CPU数)",
+    )
+    parser.add_argument(
+        "--merge-mode",
+        choices=["copy", "link"],
+        default="copy",
+        help="結果のコピー方法 (link: 分割CGNSへの外部リンクを作成)",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=["cgns", "archive"],
+        default="cgns",
+        help="出力形式 (archive: キーフレーム+差分のアーカイブ、resultフォルダ入力時のみ)",
+    )
+    parser.add_argument(
+        "--keyframe-interval",
+        type=int,
+        default=10,
+        help="アーカイブのキーフレーム間隔 (ステップ数)",
+    )
+    parser.add_argument(
+        "--time-start",
+        type=float,
+        help="復元する時刻範囲の開始 (rehydrate)",
+    )
+    parser.add_argument(
+        "--time-end",
+        type=float,
+        help="復元する時刻範囲の終了 (rehydrate)",
+    )
+    parser.add_argument(
+        "--shard-mode",
+        choices=["none", "steps", "size", "time"],
+        default="none",
+        help="出力を複数CGNSに分割する基準 (resultフォルダ入力時のみ)",
+    )
+    parser.add_argument(
+        "--shard-max-steps",
+        type=int,
+        default=100,
+        help="シャードあたりの最大ステップ数 (shard-mode=steps)",
+    )
+    parser.add_argument(
+        "--shard-max-size-mb",
+        type=float,
+        default=10240.0,
+        help="シャードあたりの最大サイズ[MB]の目安 (shard-mode=size)",
+    )
+    parser.add_argument(
+        "--shard-time-window",
+        type=float,
+        default=3600.0,
+        help="シャードあたりの時間幅 (shard-mode=time, 既定: 3600)",
+    )
     return parser
 
 
@@ -521,12 +1461,58 @@ def main(argv=None):
     parser = build_parser()
     args = parser.parse_args(argv)
 
+    if args.materialize or args.rehydrate:
+        if args.project or args.result_dir_input:
+            print("エラー: --materialize / --rehydrate は入力パスと同時に指定できません。")
+            return 2
+        if args.materialize and args.rehydrate:
+            print("エラー: --materialize と --rehydrate は同時に指定できません。")
+            return 2
+        try:
+            if args.materialize:
+                output_cgns = materialize_linked_cgns(
+                    Path(args.materialize).expanduser(),
+                    Path(args.output_dir).expanduser(),
+                    args.output_cgns_name,
+                )
+            else:
+                output_cgns = rehydrate_archive(
+                    Path(args.rehydrate).expanduser(),
+                    Path(args.output_dir).expanduser(),
+                    args.output_cgns_name,
+                    args.time_start,
+                    args.time_end,
+                )
+        except MergerError as exc:
+            print(f"エラー: {exc}")
+            return exc.exit_code
+        except Exception as exc:
+            print(f"想定外エラー: {exc}")
+            return 10
+        print(f"出力完了: {output_cgns}")
+        return 0
+
     if args.project and args.result_dir_input:
         print("エラー: --project と --result-dir-input は同時に指定できません。")
         return 2
     if not args.project and not args.result_dir_input:
         print("エラー: 入力パスが指定されていません。")
         return 2
+    if args.workers < 0:
+        print("エラー: 並列数は 0 以上で指定してください。")
+        return 2
+    if args.project and args.shard_mode != "none":
+        print("エラー: シャード出力は --result-dir-input 指定時のみ利用できます。")
+        return 2
+    if args.output_format == "archive":
+        if args.project:
+            print("エラー: アーカイブ出力は --result-dir-input 指定時のみ利用できます。")
+            return 2
+        if args.shard_mode != "none" or args.merge_mode == "link" or args.verify:
+            print(
+                "エラー: アーカイブ出力ではシャード出力・リンクモード・検証は利用できません。"
+            )
+            return 2
 
     output_dir = Path(args.output_dir).expanduser()
     output_cgns_name = args.output_cgns_name or "Case1.cgn"
@@ -547,6 +1533,9 @@ def main(argv=None):
                 thin_keep_last=thin_keep_last,
                 dry_run=args.dry_run,
                 output_cgns_name=output_cgns_name,
+                verify=args.verify,
+                workers=args.workers,
+                merge_mode=args.merge_mode,
             )
         else:
             result_dir = Path(args.result_dir_input).expanduser()
@@ -561,6 +1550,15 @@ def main(argv=None):
                 thin_keep_last=thin_keep_last,
                 dry_run=args.dry_run,
                 output_cgns_name=output_cgns_name,
+                verify=args.verify,
+                workers=args.workers,
+                shard_mode=args.shard_mode,
+                shard_max_steps=args.shard_max_steps,
+                shard_max_size_mb=args.shard_max_size_mb,
+                shard_time_window=args.shard_time_window,
+                merge_mode=args.merge_mode,
+                output_format=args.output_format,
+                keyframe_interval=args.keyframe_interval,
             )
     except MergerError as exc:
         print(f"エラー: {exc}")